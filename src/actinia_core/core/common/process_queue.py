@@ -304,6 +304,7 @@ class EnqueuedProcess(object):
                 iteration=self.iteration,
                 document=document,
                 expiration=self.config.REDIS_RESOURCE_EXPIRE_TIME,
+                response_model=response_model,
             )
 
 
@@ -36,6 +36,66 @@ __copyright__ = (
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
+# The connection pools of this process, one for each redis server. They are
+# shared by all redis interfaces, so that short living interfaces, like the
+# resource logger of a request, reuse the open connections.
+connection_pools = dict()
+
+
+def get_connection_pool(host="localhost", port=6379, password=None):
+    """Return the shared connection pool of a specific redis server
+
+    The pool is created if it does not exist yet.
+
+    Args:
+        host (str): The host name or IP address
+        port (int): The port
+        password (str): The password
+
+    Returns:
+        tuple: The connection pool and True if it was created, False otherwise
+
+    """
+    pool_key = (host, port, password or None)
+    connection_pool = connection_pools.get(pool_key)
+    if connection_pool is not None:
+        return connection_pool, False
+    kwargs = dict()
+    kwargs["host"] = host
+    kwargs["port"] = port
+    if password and password is not None:
+        kwargs["password"] = password
+    connection_pool = connection_pools.setdefault(
+        pool_key, redis.ConnectionPool(**kwargs)
+    )
+    return connection_pool, True
+
+
+def disconnect_connection_pools():
+    """Close all connections of the shared connection pools"""
+    while connection_pools:
+        _, connection_pool = connection_pools.popitem()
+        connection_pool.disconnect()
+
+
+def ping(redis_server, host, port):
+    """Check the connection to a redis server and log connection errors
+
+    Args:
+        redis_server (redis.StrictRedis): The redis client
+        host (str): The host name or IP address
+        port (int): The port
+
+    """
+    try:
+        redis_server.ping()
+    except redis.exceptions.ResponseError as e:
+        log.error("Could not connect to %s:%s %s", host, port, str(e))
+    except redis.exceptions.AuthenticationError:
+        log.error("Invalid password")
+    except redis.exceptions.ConnectionError as e:
+        log.error(str(e))
+
 
 class RedisBaseInterface(object):
     """
@@ -49,30 +109,30 @@ class RedisBaseInterface(object):
     def connect(self, host="localhost", port=6379, password=None):
         """Connect to a specific redis server
 
+        The connection pool of the server is shared with all other interfaces
+        of this process. The connection is only checked when the pool is
+        created.
+
         Args:
             host (str): The host name or IP address
             port (int): The port
             password (str): The password
 
         """
-        kwargs = dict()
-        kwargs["host"] = host
-        kwargs["port"] = port
-        if password and password is not None:
-            kwargs["password"] = password
-        self.connection_pool = redis.ConnectionPool(**kwargs)
-        del kwargs
+        self.connection_pool, created = get_connection_pool(
+            host, port, password
+        )
         self.redis_server = redis.StrictRedis(
             connection_pool=self.connection_pool
         )
-        try:
-            self.redis_server.ping()
-        except redis.exceptions.ResponseError as e:
-            log.error("Could not connect to " + host, port, str(e))
-        except redis.exceptions.AuthenticationError:
-            log.error("Invalid password")
-        except redis.exceptions.ConnectionError as e:
-            log.error(str(e))
+        if created is True:
+            ping(self.redis_server, host, port)
 
     def disconnect(self):
-        self.connection_pool.disconnect()
+        """Release the shared connection pool
+
+        The connections stay open for the other interfaces, they are closed
+        with disconnect_connection_pools().
+        """
+        self.connection_pool = None
+        self.redis_server = None
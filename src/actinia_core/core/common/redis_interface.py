@@ -28,7 +28,11 @@ import rq
 from redis import Redis
 from actinia_core.core.redis_user import redis_user_interface
 from actinia_core.core.redis_api_log import redis_api_log_interface
+from actinia_core.core.redis_cache import redis_cache_interface
+from actinia_core.core.redis_lock import redis_lock_interface
+from actinia_core.core.redis_resources import resource_update_listener
 from actinia_core.core.logging_interface import log
+from .redis_base import disconnect_connection_pools, get_connection_pool
 from .config import global_config
 from .process_queue import enqueue_job as enqueue_job_local
 
@@ -58,39 +62,46 @@ def connect(host, port, pw=None):
     """
     redis_user_interface.connect(host, port, pw)
     redis_api_log_interface.connect(host, port, pw)
+    redis_cache_interface.connect(host, port, pw)
+    redis_lock_interface.connect(host, port, pw)
 
 
 def disconnect():
     """Disconnect all required redis interfaces"""
     redis_user_interface.disconnect()
     redis_api_log_interface.disconnect()
+    redis_cache_interface.disconnect()
+    redis_lock_interface.disconnect()
+    resource_update_listener.stop()
+    disconnect_connection_pools()
 
 
 def __create_job_queue(queue_name):
     """Create a single job queue for asynchronous processing
 
+    All job queues share a single redis connection and its connection pool.
+
     Args:
         queue_name: The name of the queue
 
+    Returns:
+        rq.Queue: The job queue
+
     """
     # Redis work queue and connection
-    global job_queues, redis_conn
+    global redis_conn
 
     host = global_config.REDIS_QUEUE_SERVER_URL
     port = global_config.REDIS_QUEUE_SERVER_PORT
     password = global_config.REDIS_QUEUE_SERVER_PASSWORD
 
-    kwargs = dict()
-    kwargs["host"] = host
-    kwargs["port"] = port
-    if password and password is not None:
-        kwargs["password"] = password
-    redis_conn = Redis(**kwargs)
+    if redis_conn is None:
+        connection_pool, _ = get_connection_pool(host, port, password)
+        redis_conn = Redis(connection_pool=connection_pool)
 
     string = "Create queue %s with server %s:%s" % (queue_name, host, port)
     log.info(string)
-    queue = rq.Queue(queue_name, connection=redis_conn)
-    job_queues.append(queue)
+    return rq.Queue(queue_name, connection=redis_conn)
 
 
 def __enqueue_job_redis(queue, timeout, func, *args):
@@ -134,17 +145,15 @@ def enqueue_job(timeout, func, *args, queue_type_overwrite=None):
     if queue_type == "per_job":
         resource_id = args[0].resource_id
         queue_name = "%s_%s" % (global_config.WORKER_QUEUE_PREFIX, resource_id)
-        __create_job_queue(queue_name)
-        for i in job_queues:
-            if i.name == queue_name:
-                args[0].set_queue_name(queue_name)
-                __enqueue_job_redis(i, timeout, func, *args)
+        queue = __create_job_queue(queue_name)
+        args[0].set_queue_name(queue_name)
+        __enqueue_job_redis(queue, timeout, func, *args)
 
     elif queue_type == "redis":
         if job_queues == []:
             for i in range(num_queues):
                 queue_name = "%s_%s" % (global_config.WORKER_QUEUE_PREFIX, i)
-                __create_job_queue(queue_name)
+                job_queues.append(__create_job_queue(queue_name))
         # The redis incr approach is used here
         # to chose for each job a different queue
         num = redis_conn.incr("actinia_worker_count", 1)
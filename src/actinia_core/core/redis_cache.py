@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2023 mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Redis server cache interface
+"""
+
+from actinia_core.core.common.redis_base import RedisBaseInterface
+
+__license__ = "GPLv3"
+__author__ = "mundialis"
+__copyright__ = "Copyright 2023, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis"
+
+
+class RedisCacheInterface(RedisBaseInterface):
+    """
+    The Redis cache database interface
+    """
+
+    # Cache entries are Key-Value pairs in the Redis database using SETEX
+    # and GET for management
+    cache_prefix = "CACHE::"
+    # The generation counters of the cache namespaces using GET and INCR
+    generation_prefix = "CACHE-GENERATION::"
+    # The time in seconds a generation counter is kept after its last
+    # increment. It must be much longer than the expiration of the cache
+    # entries, since a restarted counter reuses the old generations.
+    generation_expiration = 30 * 24 * 3600
+
+    def __init__(self):
+        """
+        The cache database stores short living results of requests that
+        would otherwise require a job in the process queue. All entries
+        expire after a short time, hence the keys should contain
+        everything that invalidates an entry, like the modification time of
+        a location directory.
+        """
+        RedisBaseInterface.__init__(self)
+
+    def get(self, key):
+        """Get a cache entry
+
+        Args:
+            key (str): The key of the cache entry
+
+        Returns:
+            bytes:
+            The cache entry or None
+        """
+        return self.redis_server.get(self.cache_prefix + key)
+
+    def set(self, key, value, expiration=60):
+        """Set or update a cache entry
+
+        Args:
+            key (str): The key of the cache entry
+            value (str): The entry that should be put in the database
+            expiration (int): The time in seconds when this entry should
+                              expire
+
+        Returns:
+            bool:
+            True for success, False otherwise
+        """
+        return bool(
+            self.redis_server.setex(self.cache_prefix + key, expiration, value)
+        )
+
+    def get_generation(self, namespace):
+        """Get the generation of the cache entries of a namespace
+
+        The generation is part of the keys of the cache entries of a
+        namespace, hence all entries are invalidated at once by starting a
+        new generation. The outdated entries expire.
+
+        Args:
+            namespace (str): The namespace, for example "group/location"
+
+        Returns:
+            int:
+            The current generation of the namespace
+        """
+        generation = self.redis_server.get(self.generation_prefix + namespace)
+        if generation is None:
+            return 0
+        return int(generation)
+
+    def new_generation(self, namespace):
+        """Invalidate all cache entries of a namespace by starting a new
+        generation
+
+        Args:
+            namespace (str): The namespace, for example "group/location"
+
+        Returns:
+            int:
+            The new generation of the namespace
+        """
+        key = self.generation_prefix + namespace
+        pipeline = self.redis_server.pipeline()
+        pipeline.incr(key)
+        pipeline.expire(key, self.generation_expiration)
+        generation, _ = pipeline.execute()
+        return generation
+
+
+# Create the Redis interface instance
+redis_cache_interface = RedisCacheInterface()
@@ -27,6 +27,8 @@ Redis server lock interface
 
 import redis
 
+from actinia_core.core.common.redis_base import get_connection_pool
+
 __license__ = "GPLv3"
 __author__ = "Sören Gebbert"
 __copyright__ = (
@@ -40,6 +42,28 @@ __credits__ = [
 ]
 
 
+def generate_mapset_lock_id(user_group, location_name, mapset_name):
+    """Generate a unique id to lock a mapset in the redis database
+
+    Locations are user group specific. Hence different user groups may have
+    locations with the same names and with equal mapset names.
+
+    In the same user group, a location/mapset must be locked to grant
+    exclusive access rights.
+
+    Args:
+        user_group: The user group used for locking
+        location_name: The location name in which the mapset is located
+                       for locking
+        mapset_name: The mapset name that should be locked
+
+    Returns:
+        The lock id
+
+    """
+    return "%s/%s/%s" % (user_group, location_name, mapset_name)
+
+
 class RedisLockingInterface(object):
     """
     The Redis locking database interface
@@ -107,13 +131,7 @@ class RedisLockingInterface(object):
             password (str): The password
 
         """
-        kwargs = dict()
-        kwargs["host"] = host
-        kwargs["port"] = port
-        if password and password is not None:
-            kwargs["password"] = password
-        self.connection_pool = redis.ConnectionPool(**kwargs)
-        del kwargs
+        self.connection_pool, _ = get_connection_pool(host, port, password)
         self.redis_server = redis.StrictRedis(
             connection_pool=self.connection_pool
         )
@@ -130,7 +148,9 @@ class RedisLockingInterface(object):
         )
 
     def disconnect(self):
-        self.connection_pool.disconnect()
+        """Release the shared connection pool"""
+        self.connection_pool = None
+        self.redis_server = None
 
     """
     LOCK
@@ -230,9 +250,54 @@ class RedisLockingInterface(object):
         # print("UnLock", self.lock_prefix + str(resource_id), str(self))
         return self.call_unlock_resource(keys=keys)
 
+    def lock_many(self, resource_ids, expiration=30):
+        """Lock a list of resources for a specific time frame
+
+        All locks are requested in a single pipeline, each lock is acquired
+        atomically.
+
+        Args:
+            resource_ids (list): Names of the resources to lock, for example
+                                 ["location/mapset_a", "location/mapset_b"]
+            expiration (int): The time in seconds for which the locks are
+                              acquired
+
+        Returns:
+             list:
+             1 for success and 0 if unable to acquire the lock for each
+             resource
+
+        """
+        pipe = self.redis_server.pipeline(transaction=False)
+        for resource_id in resource_ids:
+            keys = [self.lock_prefix + str(resource_id), expiration]
+            self.call_lock_resource(keys=keys, client=pipe)
+        return pipe.execute()
+
+    def unlock_many(self, resource_ids):
+        """Unlock a list of resources in a single pipeline
+
+        Args:
+            resource_ids (list): Names of the resources to remove the lock,
+                                 for example
+                                 ["location/mapset_a", "location/mapset_b"]
+
+        Returns:
+            list:
+            1 for success and 0 if unable to unlock for each resource
+
+        """
+        pipe = self.redis_server.pipeline(transaction=False)
+        for resource_id in resource_ids:
+            keys = [
+                self.lock_prefix + str(resource_id),
+            ]
+            self.call_unlock_resource(keys=keys, client=pipe)
+        return pipe.execute()
+
 
 # Create the Redis interface instance
-# redis_lock_interface = RedisLockingInterface()
+redis_lock_interface = RedisLockingInterface()
 
 
 def test_locking(r):
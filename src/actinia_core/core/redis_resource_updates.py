@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2023 mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Redis resource update listener
+"""
+
+import os
+import threading
+import time
+
+import redis
+
+from actinia_core.core.logging_interface import log
+
+__license__ = "GPLv3"
+__author__ = "mundialis"
+__copyright__ = "Copyright 2023, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis"
+
+
+class ResourceUpdateSubscription(object):
+    """The subscription of a single waiting request to the update
+    announcements of a resource entry
+    """
+
+    def __init__(self, listener, channel):
+        self.listener = listener
+        self.channel = channel
+        self.event = threading.Event()
+
+    def wait(self, timeout):
+        """Wait until an update of the resource was announced or the timeout
+        was reached
+
+        Args:
+            timeout (float): The maximum time to wait in seconds
+
+        Returns:
+            bool:
+            True if an update was announced, False otherwise
+
+        """
+        announced = self.event.wait(timeout)
+        self.event.clear()
+        return announced
+
+    def close(self):
+        """Remove the subscription from the listener"""
+        self.listener.unsubscribe(self)
+
+
+class ResourceUpdateListener(object):
+    """Listen to the update announcements of all resource entries with a
+    single pattern subscription and dispatch them to the waiting requests
+
+    All requests of a process that wait for a job share the redis
+    connection of the listener, instead of opening a subscription each.
+    The listener runs in a daemon thread, that is started by the first
+    subscription of the process.
+    """
+
+    def __init__(self, pattern):
+        """
+        Args:
+            pattern (str): The channel pattern of the resource updates
+        """
+        self.pattern = pattern
+        self.lock = threading.Lock()
+        # The subscriptions of the waiting requests by channel
+        self.subscriptions = dict()
+        self.pubsub = None
+        self.pid = None
+
+    def subscribe(self, connection_pool, channel):
+        """Subscribe to the update announcements of a resource entry
+
+        Args:
+            connection_pool (redis.ConnectionPool): The connection pool used
+                                                    to start the listener
+            channel (str): The update channel of the resource entry
+
+        Returns:
+            ResourceUpdateSubscription:
+            The subscription, that must be closed by the caller
+
+        """
+        subscription = ResourceUpdateSubscription(self, channel)
+        with self.lock:
+            # The listener thread does not survive a fork of the process
+            if self.pubsub is None or self.pid != os.getpid():
+                self._start(connection_pool)
+            self.subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Remove a subscription
+
+        Args:
+            subscription (ResourceUpdateSubscription): The subscription
+        """
+        with self.lock:
+            subscriptions = self.subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.subscriptions[subscription.channel]
+
+    def stop(self):
+        """Stop the listener, it is started again by the next subscription"""
+        with self.lock:
+            pubsub = self.pubsub
+            self.pubsub = None
+            self.pid = None
+        if pubsub is not None:
+            pubsub.close()
+
+    def _start(self, connection_pool):
+        """Subscribe the channel pattern and start the listener thread
+
+        The subscription is confirmed before the thread is started, so that
+        no update is lost that is announced after subscribe() returned.
+        """
+        redis_server = redis.StrictRedis(connection_pool=connection_pool)
+        pubsub = redis_server.pubsub()
+        pubsub.psubscribe(self.pattern)
+        pubsub.get_message(timeout=1.0)
+        self.pubsub = pubsub
+        self.pid = os.getpid()
+        thread = threading.Thread(target=self._run, args=(pubsub,))
+        thread.daemon = True
+        thread.start()
+
+    def _run(self, pubsub):
+        """Dispatch the update announcements until the listener was stopped
+
+        Args:
+            pubsub (redis.client.PubSub): The pattern subscription
+        """
+        while pubsub is self.pubsub:
+            try:
+                message = pubsub.get_message(timeout=1.0)
+            except Exception as e:
+                if pubsub is not self.pubsub:
+                    return
+                # The subscription is restored with the next message request
+                log.error("Resource update listener error: %s" % str(e))
+                time.sleep(1.0)
+                continue
+            if message is None or message["type"] != "pmessage":
+                continue
+            channel = message["channel"].decode()
+            with self.lock:
+                subscriptions = list(self.subscriptions.get(channel, ()))
+            for subscription in subscriptions:
+                subscription.event.set()
@@ -26,6 +26,7 @@ Redis server resource logging interface
 """
 
 from actinia_core.core.common.redis_base import RedisBaseInterface
+from actinia_core.core.redis_resource_updates import ResourceUpdateListener
 
 __license__ = "GPLv3"
 __author__ = "Sören Gebbert"
@@ -44,6 +45,31 @@ class RedisResourceInterface(RedisBaseInterface):
     # The database to store the long pending resource status and results
     resource_id_prefix = "RESOURCE-ID::"
     resource_id_termination_prefix = "RESOURCE-ID-TERMINATION::"
+    # Every update of a resource entry is announced on this channel
+    resource_id_channel_prefix = "RESOURCE-ID-CHANNEL::"
+    # The resource that currently runs a job identified by a job key
+    resource_id_inflight_prefix = "RESOURCE-ID-INFLIGHT::"
+
+    # LUA script to register a resource as inflight job, if no other resource
+    # is registered for the job key
+    # Return nil for success or the already registered resource id
+    lua_set_inflight = """
+    local value = redis.call("GET", KEYS[1])
+    if value then
+      return value
+    end
+    redis.call("SETEX", KEYS[1], ARGV[2], ARGV[1])
+    return nil
+    """
+
+    # LUA script to remove the inflight job entry of a resource
+    # Return 1 for success, 0 if the resource is not registered
+    lua_delete_inflight = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+      return redis.call("DEL", KEYS[1])
+    end
+    return 0
+    """
 
     def __init__(self):
         """
@@ -60,6 +86,10 @@ class RedisResourceInterface(RedisBaseInterface):
         8640000 seconds (100 days) by default. This can also be set using the
         Actinia Core config file.
 
+        Each update of a resource entry is published on a resource specific
+        channel, so that processes waiting for a resource to finish can
+        subscribe to it instead of polling the resource entry.
+
         The following scheme should be used::
 
             Client         GRASS Server              Resource DB
@@ -122,7 +152,8 @@ class RedisResourceInterface(RedisBaseInterface):
         RedisBaseInterface.__init__(self)
 
     def set(self, resource_id, resource_entry, expiration=864000):
-        """Set or update a resource entry
+        """Set or update a resource entry and notify the subscribers of the
+        resource channel
 
         Args:
             resource_id (str): The unique id of the resource
@@ -131,9 +162,29 @@ class RedisResourceInterface(RedisBaseInterface):
                               expire
 
         """
-        return self.redis_server.setex(
+        pipe = self.redis_server.pipeline(transaction=False)
+        pipe.setex(
             self.resource_id_prefix + resource_id, expiration, resource_entry
         )
+        pipe.publish(self.resource_id_channel_prefix + resource_id, 1)
+        return pipe.execute()[0]
+
+    def subscribe(self, resource_id):
+        """Subscribe to the update channel of a resource entry
+
+        All subscriptions of the process share the connection of the
+        resource update listener.
+
+        Args:
+            resource_id (str): The unique id of the resource
+
+        Returns:
+            ResourceUpdateSubscription:
+            The subscription object, that must be closed by the caller
+        """
+        return resource_update_listener.subscribe(
+            self.connection_pool, self.resource_id_channel_prefix + resource_id
+        )
 
     def set_termination(self, resource_id, expiration=3600):
         """Set or update a resource termination entry
@@ -152,6 +203,49 @@ class RedisResourceInterface(RedisBaseInterface):
             self.resource_id_termination_prefix + resource_id, expiration, 1
         )
 
+    def set_inflight(self, job_key, resource_id, expiration=30):
+        """Register a resource as the one that runs the job with the job key
+
+        Args:
+            job_key (str): The key that identifies identical jobs
+            resource_id (str): The unique id of the resource
+            expiration (int): The time in seconds when this entry should
+                              expire
+
+        Returns:
+            str:
+            None if the resource was registered, otherwise the id of the
+            resource that already runs the job
+        """
+        value = self.redis_server.eval(
+            self.lua_set_inflight,
+            1,
+            self.resource_id_inflight_prefix + job_key,
+            resource_id,
+            expiration,
+        )
+        if value is None:
+            return None
+        return value.decode()
+
+    def delete_inflight(self, job_key, resource_id):
+        """Remove the inflight job entry of a resource
+
+        Args:
+            job_key (str): The key that identifies identical jobs
+            resource_id (str): The unique id of the resource
+
+        Returns:
+            int:
+            1 for success, 0 if the resource is not registered for the job key
+        """
+        return self.redis_server.eval(
+            self.lua_delete_inflight,
+            1,
+            self.resource_id_inflight_prefix + job_key,
+            resource_id,
+        )
+
     def get(self, resource_id):
         """Get the resource entry if exists
 
@@ -267,6 +361,11 @@ class RedisResourceInterface(RedisBaseInterface):
 # Create the Redis interface instance
 # redis_resource_interface = RedisResourceInterface()
 
+# The listener of all resource update announcements of this process
+resource_update_listener = ResourceUpdateListener(
+    RedisResourceInterface.resource_id_channel_prefix + "*"
+)
+
 
 def test_resource_entries(r):
 
@@ -42,6 +42,34 @@ class ResourceDataContainer(object):
     to the enqueued asynchronous processing object
     """
 
+    # The attributes that are pickled when the container is send to the
+    # process queue or the redis job queue. They are stored as flat tuple in
+    # this order, to avoid pickling the attribute names of the instance dict.
+    # Any other attribute of the instance is pickled with its name.
+    _state_attributes = (
+        "grass_data_base",
+        "grass_user_data_base",
+        "grass_base_dir",
+        "request_data",
+        "user_id",
+        "user_group",
+        "resource_id",
+        "iteration",
+        "status_url",
+        "api_info",
+        "resource_url_base",
+        "user_credentials",
+        "config",
+        "location_name",
+        "mapset_name",
+        "map_name",
+        "orig_time",
+        "orig_datetime",
+        "user_data",
+        "storage_model",
+        "queue",
+    )
+
     def __init__(
         self,
         grass_data_base,
@@ -117,6 +145,26 @@ class ResourceDataContainer(object):
     # def __str__(self):
     #    return str(self.__dict__)
 
+    def __getstate__(self):
+        values = tuple(getattr(self, attr) for attr in self._state_attributes)
+        # Attributes that were added to the instance are kept by name
+        extra_attributes = {
+            attr: value
+            for attr, value in self.__dict__.items()
+            if attr not in self._state_attributes
+        }
+        return values, extra_attributes
+
+    def __setstate__(self, state):
+        # Containers pickled by previous releases carry the instance dict
+        if isinstance(state, dict):
+            self.__dict__.update(state)
+            return
+        values, extra_attributes = state
+        for attr, value in zip(self._state_attributes, values):
+            setattr(self, attr, value)
+        self.__dict__.update(extra_attributes)
+
     def set_user_data(self, user_data):
         """Put all required data for processing into the data object
 
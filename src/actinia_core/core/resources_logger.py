@@ -87,7 +87,13 @@ class ResourceLogger(RedisFluentLoggerBase):
             return 1
 
     def commit(
-        self, user_id, resource_id, iteration, document, expiration=8640000
+        self,
+        user_id,
+        resource_id,
+        iteration,
+        document,
+        expiration=8640000,
+        response_model=None,
     ):
         """Commit a resource entry to the database, create a new one if it
         does not exists, update existing resource entries
@@ -99,6 +105,9 @@ class ResourceLogger(RedisFluentLoggerBase):
             document (str): The pickled document to store in the database
             expiration (int): Number of seconds of expiration time, default
                               8640000s hence 100 days
+            response_model (dict): The response model that was pickled in
+                                   the document. If it is not provided, the
+                                   document is unpickled for logging.
 
         Returns:
             bool:
@@ -110,8 +119,9 @@ class ResourceLogger(RedisFluentLoggerBase):
             user_id, resource_id, iteration
         )
         redis_return = bool(self.db.set(db_resource_id, document, expiration))
-        http_code, data = pickle.loads(document)
-        data["logger"] = "resources_logger"
+        if response_model is None:
+            http_code, response_model = pickle.loads(document)
+        data = dict(response_model, logger="resources_logger")
         self.send_to_logger("RESOURCE_LOG", data)
         return redis_return
 
@@ -157,6 +167,74 @@ class ResourceLogger(RedisFluentLoggerBase):
         )
         return self.db.get(db_resource_id)
 
+    def subscribe(self, user_id, resource_id, iteration=None):
+        """Subscribe to the updates of a resource entry
+
+        Args:
+            user_id (str): The user id
+            resource_id (str): The resource id
+            iteration (int): The iteration of the job
+
+        Returns:
+            ResourceUpdateSubscription:
+            The subscription object, that must be closed by the caller
+
+        """
+        db_resource_id = self._generate_db_resource_id(
+            user_id, resource_id, iteration
+        )
+        return self.db.subscribe(db_resource_id)
+
+    def set_inflight(
+        self, job_key, user_id, resource_id, iteration=None, expiration=30
+    ):
+        """Register a resource as the one that runs the job with the job key
+
+        Args:
+            job_key (str): The key that identifies identical jobs
+            user_id (str): The user id
+            resource_id (str): The resource id
+            iteration (int): The iteration of the job
+            expiration (int): Number of seconds of expiration time
+
+        Returns:
+            tuple:
+            None if the resource was registered, otherwise the user id,
+            resource id and iteration of the resource that already runs the
+            job
+
+        """
+        db_resource_id = self._generate_db_resource_id(
+            user_id, resource_id, iteration
+        )
+        inflight = self.db.set_inflight(job_key, db_resource_id, expiration)
+        if inflight is None:
+            return None
+        inflight_user_id, inflight_resource_id = inflight.split("/")[:2]
+        inflight_iteration = self._get_iteration_from_db_resource_id(inflight)
+        if inflight_iteration == 1:
+            inflight_iteration = None
+        return inflight_user_id, inflight_resource_id, inflight_iteration
+
+    def delete_inflight(self, job_key, user_id, resource_id, iteration=None):
+        """Remove the inflight job entry of a resource
+
+        Args:
+            job_key (str): The key that identifies identical jobs
+            user_id (str): The user id
+            resource_id (str): The resource id
+            iteration (int): The iteration of the job
+
+        Returns:
+            bool:
+            True for success, False otherwise
+
+        """
+        db_resource_id = self._generate_db_resource_id(
+            user_id, resource_id, iteration
+        )
+        return bool(self.db.delete_inflight(job_key, db_resource_id))
+
     def get_latest_iteration(self, user_id, resource_id=None):
         """Get resource entry with latest iteration
 
@@ -44,6 +44,7 @@ from actinia_core.rest.mapset_management import (
     MapsetManagementResourceUser,
 )
 from actinia_core.rest.mapset_management import (
+    MapsetLockBatchResource,
     MapsetLockManagementResource,
     MapsetManagementResourceAdmin,
 )
@@ -161,6 +162,10 @@ def create_core_endpoints():
         MapsetLockManagementResource,
         "/locations/<string:location_name>/mapsets/<string:mapset_name>/lock",
     )
+    flask_api.add_resource(
+        MapsetLockBatchResource,
+        "/locations/<string:location_name>/mapsets/lock_batch",
+    )
 
     # Raster management
     flask_api.add_resource(
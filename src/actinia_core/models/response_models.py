@@ -1240,10 +1240,10 @@ def create_response_from_model(
         api_info (ApiInfoModel): Information about the API call, important for
                                  accounting
         process_chain_list ([ProcessChainModel]): The list of process chains
-        resp_type (str): What type of response, "pickle" or "json"
+        resp_type (str): What type of response, "pickle", "model" or "json"
 
     Returns:
-        A pickle string or json string
+        A pickle string, a (http_code, response model) tuple or json string
 
     """
     # if issubclass(response_model_class, ProcessingResponseModel) is False:
@@ -1297,6 +1297,8 @@ def create_response_from_model(
 
     if resp_type == "pickle":
         return pickle.dumps([http_code, resp_dict])
+    elif resp_type == "model":
+        return http_code, resp_dict
     else:
         return jsonify(resp_dict)
 
@@ -34,6 +34,7 @@ from actinia_core.processing.actinia_processing.ephemeral_processing import (
 )
 from actinia_core.core.common.exceptions import AsyncProcessError
 from actinia_core.core.mapset_merge_utils import change_mapsetname
+from actinia_core.core.redis_lock import generate_mapset_lock_id
 
 __license__ = "GPLv3"
 __author__ = "Sören Gebbert, Guido Riembauer, Anika Weinmann, Lina Krisztian"
@@ -107,12 +108,6 @@ class PersistentProcessing(EphemeralProcessing):
     def _generate_mapset_lock_id(self, user_group, location_name, mapset_name):
         """Generate a unique id to lock a mapset in the redis database
 
-        Locations are user group specific. Hence different user groups may have
-        locations with the same names and with equal mapset names.
-
-        In the same user group, a location/mapset must be locked to grant
-        exclusive access rights.
-
         Args:
             user_group: The user group used for locking
             location_name: The location name in which the mapset is located
@@ -123,7 +118,7 @@ class PersistentProcessing(EphemeralProcessing):
             The lock id
 
         """
-        return "%s/%s/%s" % (user_group, location_name, mapset_name)
+        return generate_mapset_lock_id(user_group, location_name, mapset_name)
 
     def _lock_temp_mapset(self):
         """Lock the temporary mapset
@@ -322,3 +322,75 @@ class PersistentMapsetUnlocker(PersistentProcessing):
             self.finish_message = (
                 "Mapset <%s> successfully unlocked" % self.target_mapset_name
             )
+
+
+class PersistentMapsetBatchLocker(PersistentProcessing):
+    """Lock or unlock a list of mapsets
+
+    The request data is a dictionary with the list of mapset names and the
+    operation "lock" or "unlock". The locks of all existing mapsets are set
+    or removed in a single redis pipeline. The result is a list with the
+    status of each mapset.
+    """
+
+    def __init__(self, *args):
+        PersistentProcessing.__init__(self, *args)
+
+    def _execute(self):
+        self._setup()
+        operation = self.request_data["op"]
+
+        mapset_status = []
+        lock_ids = []
+        for mapset_name in self.request_data["mapsets"]:
+            status = dict(mapset=mapset_name, status="error")
+            mapset_status.append(status)
+            try:
+                mapset_exists = self._check_mapset(mapset_name)
+            except AsyncProcessError as e:
+                status["message"] = str(e)
+                continue
+            if mapset_exists is False:
+                status["message"] = "Mapset does not exist"
+                continue
+            lock_ids.append(
+                (
+                    status,
+                    self._generate_mapset_lock_id(
+                        self.user_group, self.location_name, mapset_name
+                    ),
+                )
+            )
+
+        if operation == "lock":
+            rets = self.lock_interface.lock_many(
+                [lock_id for _, lock_id in lock_ids],
+                expiration=self.process_time_limit * self.process_num_limit,
+            )
+            for (status, _), ret in zip(lock_ids, rets):
+                if ret == 0:
+                    status["message"] = "Mapset is already locked"
+                else:
+                    status["status"] = "success"
+                    status["message"] = "Mapset successfully locked"
+        else:
+            self.lock_interface.unlock_many(
+                [lock_id for _, lock_id in lock_ids]
+            )
+            for status, _ in lock_ids:
+                status["status"] = "success"
+                status["message"] = "Mapset successfully unlocked"
+
+        self.module_results = mapset_status
+        self.finish_message = "%i of %i mapsets successfully %sed" % (
+            len([s for s in mapset_status if s["status"] == "success"]),
+            len(mapset_status),
+            operation,
+        )
+
+    def _final_cleanup(self):
+        """
+        Final cleanup called in the run function at the very end of processing
+        """
+        # Clean up and remove the temporary files
+        self._cleanup()
@@ -95,6 +95,14 @@ PersistentMapsetUnlocker = try_import(
     "PersistentMapsetUnlocker",
 )
 
+PersistentMapsetBatchLocker = try_import(
+    (
+        "actinia_core.processing.actinia_processing.persistent"
+        + ".mapset_management"
+    ),
+    "PersistentMapsetBatchLocker",
+)
+
 
 def list_raster_mapsets(*args):
     processing = PersistentMapsetLister(*args)
@@ -129,3 +137,8 @@ def lock_mapset(*args):
 def unlock_mapset(*args):
     processing = PersistentMapsetUnlocker(*args)
     processing.run()
+
+
+def lock_mapset_batch(*args):
+    processing = PersistentMapsetBatchLocker(*args)
+    processing.run()
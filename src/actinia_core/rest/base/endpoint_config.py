@@ -72,28 +72,30 @@ def check_endpoint(method, api_doc=None, endpoint_class=None):
 def endpoint_decorator():
     """Check whether an endpoint allowlist should be used to
     allow only the provided list of endpoints and hide all others.
+
+    The allowlist is static after the configuration was read, hence it is
+    checked once when the method is decorated. Allowed methods are returned
+    unwrapped, so that the check does not cost anything per request.
     """
 
     def decorator(func):
         endpoint_class, method = func.__qualname__.split(".")
 
+        if check_endpoint(method, endpoint_class=endpoint_class):
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-
-            if check_endpoint(method, endpoint_class=endpoint_class):
-                result = func(*args, **kwargs)
-                return result
-            else:
-                return make_response(
-                    jsonify(
-                        SimpleResponseModel(
-                            status="error",
-                            message="Not Found. The requested URL is not "
-                            "configured on the server.",
-                        )
-                    ),
-                    404,
-                )
+            return make_response(
+                jsonify(
+                    SimpleResponseModel(
+                        status="error",
+                        message="Not Found. The requested URL is not "
+                        "configured on the server.",
+                    )
+                ),
+                404,
+            )
 
         return wrapper
 
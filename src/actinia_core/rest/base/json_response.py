@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2023 mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+JSON responses encoded with orjson
+"""
+import orjson
+from flask import Response
+
+__license__ = "GPLv3"
+__author__ = "mundialis"
+__copyright__ = "Copyright 2023, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis"
+
+# Sort the keys like flask.jsonify does by default
+ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+)
+
+
+def make_json_response(obj, http_code=200):
+    """Create a JSON response, replacement for
+    make_response(jsonify(obj), http_code)
+
+    The response models are dict subclasses, which orjson encodes without
+    walking them in Python.
+
+    Args:
+        obj: The response model or any other JSON serializable object
+        http_code (int): The HTTP status code
+
+    Returns:
+        flask.Response:
+        The JSON response
+    """
+    return Response(
+        orjson.dumps(obj, option=ORJSON_OPTIONS),
+        status=http_code,
+        mimetype="application/json",
+    )
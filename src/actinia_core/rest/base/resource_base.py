@@ -28,16 +28,19 @@ import os
 import pickle
 import time
 import uuid
+from copy import deepcopy
 from datetime import datetime
-from flask import make_response, jsonify
+from flask import make_response
 from flask import request, g
 from flask.json import loads as json_loads
 from flask_restful_swagger_2 import Resource
+from actinia_core.rest.base.json_response import make_json_response
 from actinia_core.rest.base.user_auth import check_user_permissions
 from actinia_core.rest.base.user_auth import create_dummy_user
 from actinia_core.core.common.app import auth
 from actinia_core.core.common.app import flask_api
 from actinia_core.core.common.config import global_config
+from actinia_core.core.common.redis_interface import enqueue_job
 from actinia_core.core.common.api_logger import log_api_call
 from actinia_core.core.messages_logger import MessageLogger
 from actinia_core.core.resources_logger import ResourceLogger
@@ -162,6 +165,9 @@ class ResourceBase(Resource):
         self.resource_url = None
         self.request_data = None
         self.response_data = None
+        # The unpickled content of self.response_data
+        self.http_code = None
+        self.response_model = None
         self.job_timeout = 0
 
         # Replace this with the correct response model in subclasses
@@ -179,11 +185,28 @@ class ResourceBase(Resource):
             kwargs["post_url"] = self.post_url
         self.api_info = ApiInfoModel(**kwargs)
 
+    def _set_response_data(self, response_model_class, **kwargs):
+        """Create a response from the response model class and set the
+        self.response_data, self.http_code and self.response_model variables
+
+        Args:
+            response_model_class (class): The response model class
+            **kwargs: The arguments of create_response_from_model()
+
+        """
+        self.http_code, self.response_model = create_response_from_model(
+            response_model_class, resp_type="model", **kwargs
+        )
+        self.response_data = pickle.dumps(
+            [self.http_code, self.response_model]
+        )
+
     def create_error_response(self, message, status="error", http_code=400):
         """Create an error response, that by default sets the status to error
         and the http_code to 400
 
-        This method sets the self.response_data variable.
+        This method sets the self.response_data, self.http_code and
+        self.response_model variables.
 
         Args:
             message: The error message
@@ -191,7 +214,7 @@ class ResourceBase(Resource):
             http_code: The hhtp code by default 400
 
         """
-        self.response_data = create_response_from_model(
+        self._set_response_data(
             self.response_model_class,
             status=status,
             user_id=self.user_id,
@@ -208,10 +231,57 @@ class ResourceBase(Resource):
             api_info=self.api_info,
         )
 
+    def create_finished_response(
+        self, results, message, response_model_class=None
+    ):
+        """Create the finished response of a request that was answered
+        without enqueueing a job and send it to the resource database
+
+        This method sets the self.response_data, self.http_code and
+        self.response_model variables.
+
+        Args:
+            results: The process results
+            message: The finish message
+            response_model_class (class): The response model class, by default
+                                          self.response_model_class
+
+        Returns:
+            (int, dict)
+            The http_code and the generated data dictionary
+
+        """
+        if response_model_class is None:
+            response_model_class = self.response_model_class
+        self._set_response_data(
+            response_model_class,
+            status="finished",
+            user_id=self.user_id,
+            resource_id=self.resource_id,
+            queue=self.queue,
+            iteration=self.iteration,
+            results=results,
+            message=message,
+            http_code=200,
+            orig_time=self.orig_time,
+            orig_datetime=self.orig_datetime,
+            status_url=self.status_url,
+            api_info=self.api_info,
+        )
+        self.resource_logger.commit(
+            user_id=self.user_id,
+            resource_id=self.resource_id,
+            iteration=self.iteration,
+            document=self.response_data,
+            response_model=self.response_model,
+        )
+        return self.http_code, self.response_model
+
     def get_error_response(self, message, status="error", http_code=400):
         """Return the error response.
 
-        This function will generate an error response using make_response()
+        This function will generate an error response using
+        make_json_response()
         In addition, a resource update is send using the error response.
 
         Args:
@@ -220,7 +290,7 @@ class ResourceBase(Resource):
             http_code: The http code by default 400
 
         Returns:
-            the result of make_response()
+            the result of make_json_response()
 
         """
         self.create_error_response(
@@ -231,9 +301,9 @@ class ResourceBase(Resource):
             resource_id=self.resource_id,
             iteration=self.iteration,
             document=self.response_data,
+            response_model=self.response_model,
         )
-        http_code, response_model = pickle.loads(self.response_data)
-        return make_response(jsonify(response_model), http_code)
+        return make_json_response(self.response_model, self.http_code)
 
     def check_for_json(self):
         """Check if the Payload is a JSON document
@@ -372,7 +442,7 @@ class ResourceBase(Resource):
             )
 
         # Create the accepted response that will be always send
-        self.response_data = create_response_from_model(
+        self._set_response_data(
             self.response_model_class,
             status="accepted",
             user_id=self.user_id,
@@ -391,7 +461,11 @@ class ResourceBase(Resource):
 
         # Send the status to the database
         self.resource_logger.commit(
-            self.user_id, self.resource_id, self.iteration, self.response_data
+            self.user_id,
+            self.resource_id,
+            self.iteration,
+            self.response_data,
+            response_model=self.response_model,
         )
 
         # Return the ResourceDataContainer that includes all
@@ -433,41 +507,234 @@ class ResourceBase(Resource):
     def generate_request_id_from_resource_id(self):
         return self.resource_id.replace("resource_id-", "request_id-")
 
-    def wait_until_finish(self, poll_time=0.2):
+    def enqueue_job_and_wait(
+        self, func, rdc, queue_type_overwrite=None, coalesce=False
+    ):
+        """Enqueue a job and wait until it finished, terminated or failed
+
+        The resource update channel is subscribed before the job is enqueued,
+        hence the resource entry must not be read before the first update of
+        the job was announced.
+
+        If coalesce is True, the job is only enqueued if no identical job
+        (same function, user group, location and mapset) is running. Otherwise
+        the request waits for the response of the running job. A copy of it,
+        that identifies this resource and user, is committed as response of
+        this resource. An error is committed instead, if the running job does
+        not finish within the job timeout.
+
+        Args:
+            func: The function to call from the subprocess/worker
+            rdc (ResourceDataContainer): The data container of the job
+            queue_type_overwrite (bool): Use the overwrite queue type of the
+                                         configuration
+            coalesce (bool): Wait for an identical running job instead of
+                             enqueueing the job
+
+        Returns:
+            (int, dict)
+            The http_code and the generated data dictionary
+        """
+        if coalesce is True:
+            job_key = "%s/%s/%s/%s" % (
+                func.__name__,
+                self.user_group,
+                rdc.location_name,
+                rdc.mapset_name,
+            )
+            inflight = self.resource_logger.set_inflight(
+                job_key, self.user_id, self.resource_id, self.iteration
+            )
+            if inflight is not None:
+                # The running job is not waited for longer than this job
+                # would run
+                result = self._wait_for_resource(
+                    *inflight, timeout=self.job_timeout
+                )
+                if isinstance(result, tuple) is False:
+                    self.get_error_response(
+                        message="Unable to receive the status of the running "
+                        "job of resource <%s>" % inflight[1]
+                    )
+                    return self.http_code, self.response_model
+                http_code, response_model = result
+                response_model = self._adopt_response_model(response_model)
+                self.resource_logger.commit(
+                    user_id=self.user_id,
+                    resource_id=self.resource_id,
+                    iteration=self.iteration,
+                    document=pickle.dumps([http_code, response_model]),
+                    response_model=response_model,
+                )
+                return http_code, response_model
+            try:
+                return self.enqueue_job_and_wait(
+                    func, rdc, queue_type_overwrite=queue_type_overwrite
+                )
+            finally:
+                self.resource_logger.delete_inflight(
+                    job_key, self.user_id, self.resource_id, self.iteration
+                )
+
+        subscription = self.resource_logger.subscribe(
+            self.user_id, self.resource_id, self.iteration
+        )
+        try:
+            enqueue_job(
+                self.job_timeout,
+                func,
+                rdc,
+                queue_type_overwrite=queue_type_overwrite,
+            )
+        except Exception as e:
+            # The subscription is only closed by waiting for the job
+            subscription.close()
+            # Requests that wait for this resource must not wait for a job
+            # that does not exist
+            self.get_error_response(
+                message="Unable to enqueue the job: %s" % str(e),
+                http_code=500,
+            )
+            raise
+        return self.wait_until_finish(subscription=subscription)
+
+    def _adopt_response_model(self, response_model):
+        """Copy the response model of another resource and set the resource
+        and user specific fields of this resource
+
+        Args:
+            response_model (dict): The response model of the other resource
+
+        Returns:
+            dict:
+            The response model of this resource
+
+        """
+        response_model = deepcopy(response_model)
+        response_model["user_id"] = self.user_id
+        response_model["resource_id"] = self.resource_id
+        response_model["api_info"] = self.api_info
+        response_model["accept_timestamp"] = self.orig_time
+        response_model["accept_datetime"] = self.orig_datetime
+        if "timestamp" in response_model:
+            response_model["time_delta"] = (
+                response_model["timestamp"] - self.orig_time
+            )
+        if "iteration" in response_model:
+            response_model["iteration"] = self.iteration
+        if "urls" in response_model:
+            response_model["urls"]["status"] = str(self.status_url)
+        return response_model
+
+    def enqueue_job_and_accept(self, func, rdc, queue_type_overwrite=None):
+        """Enqueue a job and return the accepted response without waiting
+        for the job
+
+        The client polls the status URL of the accepted response to get the
+        result of the job. Like all asynchronous resources, the accepted
+        response is delivered with HTTP 200 and the status "accepted".
+
+        Args:
+            func: The function to call from the subprocess/worker
+            rdc (ResourceDataContainer): The data container of the job
+            queue_type_overwrite (bool): Use the overwrite queue type of the
+                                         configuration
+
+        Returns:
+            (int, dict)
+            The http_code and the accepted response model
+        """
+        enqueue_job(
+            self.job_timeout,
+            func,
+            rdc,
+            queue_type_overwrite=queue_type_overwrite,
+        )
+        return self.http_code, self.response_model
+
+    def wait_until_finish(self, poll_time=0.2, subscription=None):
         """Wait until a resource finished, terminated or failed with an error
 
         Call this method if a job was enqueued and the POST/GET/DELETE/PUT
         method should wait for it
 
+        The resource entry is only read again if an update of the resource
+        was announced on its update channel, or if no announcement was received
+        within poll_time seconds.
+
         Args:
-            poll_time (float): Time to sleep between Redis db polls for process
-                               status requests
+            poll_time (float): Maximum time to wait for a resource update
+                               announcement before the Redis db is polled for
+                               the process status
+            subscription: A resource update subscription that was created
+                          before the job was enqueued, see
+                          enqueue_job_and_wait()
 
         Returns:
             (int, dict)
             The http_code and the generated data dictionary
         """
-        # Wait for the async process by asking the redis database for updates
-        while True:
-            response_data = self.resource_logger.get(
-                self.user_id, self.resource_id, self.iteration
+        return self._wait_for_resource(
+            self.user_id,
+            self.resource_id,
+            self.iteration,
+            poll_time,
+            subscription,
+        )
+
+    def _wait_for_resource(
+        self,
+        user_id,
+        resource_id,
+        iteration,
+        poll_time=0.2,
+        subscription=None,
+        timeout=None,
+    ):
+        """Wait until the resource of a user finished, terminated or failed
+        with an error, see wait_until_finish()
+
+        If timeout is set, None is returned when the resource did not reach
+        a final state within timeout seconds.
+        """
+        if timeout is not None:
+            deadline = time.time() + timeout
+        if subscription is None:
+            # Subscribe before the first read, so that no update between
+            # reading the resource entry and waiting for the announcement gets
+            # lost
+            subscription = self.resource_logger.subscribe(
+                user_id, resource_id, iteration
             )
-            if not response_data:
-                message = (
-                    "Unable to receive process status. User id "
-                    "%s resource id %s and iteration %d"
-                    % (self.user_id, self.resource_id, self.iteration)
+        else:
+            # Nothing but the accepted state can be read before the job
+            # announced its first update
+            subscription.wait(poll_time)
+        try:
+            while True:
+                response_data = self.resource_logger.get(
+                    user_id, resource_id, iteration
                 )
-                return make_response(message, 400)
-
-            http_code, response_model = pickle.loads(response_data)
-            if (
-                response_model["status"] == "finished"
-                or response_model["status"] == "error"
-                or response_model["status"] == "timeout"
-                or response_model["status"] == "terminated"
-            ):
-                break
-            time.sleep(poll_time)
+                if not response_data:
+                    message = (
+                        "Unable to receive process status. User id "
+                        "%s resource id %s and iteration %s"
+                        % (user_id, resource_id, iteration)
+                    )
+                    return make_response(message, 400)
+
+                http_code, response_model = pickle.loads(response_data)
+                if (
+                    response_model["status"] == "finished"
+                    or response_model["status"] == "error"
+                    or response_model["status"] == "timeout"
+                    or response_model["status"] == "terminated"
+                ):
+                    break
+                if timeout is not None and time.time() > deadline:
+                    return None
+                subscription.wait(poll_time)
+        finally:
+            subscription.close()
 
         return (http_code, response_model)
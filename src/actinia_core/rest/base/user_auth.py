@@ -28,8 +28,9 @@ User authentication and credential check
 import os
 from functools import wraps
 
-from flask import g, abort
+from flask import g, abort, request
 from actinia_core.core.common.config import global_config
+from actinia_core.core.common.api_logger import ApiLogger
 from actinia_core.core.common.app import auth
 from actinia_core.core.common.keycloak_user import ActiniaKeycloakUser
 from actinia_core.core.common.user import ActiniaUser
@@ -125,6 +126,11 @@ def create_dummy_user(f):
     return decorated_function
 
 
+# The roles that are allowed by check_user_role and check_admin_role
+USER_ROLES = ("user", "admin", "superadmin")
+ADMIN_ROLES = ("admin", "superadmin")
+
+
 def check_admin_role(f):
     """Verify if the user has admin rights
 
@@ -146,7 +152,7 @@ def check_admin_role(f):
         if g.user is None:
             abort(401)
 
-        if g.user.get_role() != "admin" and g.user.get_role() != "superadmin":
+        if g.user.get_role() not in ADMIN_ROLES:
             abort(401)
 
         return f(*args, **kwargs)
@@ -176,8 +182,7 @@ def check_user_role(f):
         if g.user is None:
             abort(401)
 
-        allowed_roles = ["user", "admin", "superadmin"]
-        if g.user.get_role() not in allowed_roles:
+        if g.user.get_role() not in USER_ROLES:
             abort(401)
 
         return f(*args, **kwargs)
@@ -270,35 +275,78 @@ def check_user_permissions(f):
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
+        _check_user_permissions(kwargs)
 
-        location_name = None
-        mapset_name = None
-        module_name = None
+        return f(*args, **kwargs)
 
-        if "location_name" in kwargs:
-            location_name = kwargs["location_name"]
+    return decorated_function
 
-        if "mapset_name" in kwargs:
-            mapset_name = kwargs["mapset_name"]
 
-        if "module_name" in kwargs:
-            module_name = kwargs["module_name"]
+def _check_user_permissions(kwargs):
+    """Check the user permissions for the location, mapset and module
+    arguments of a request and abort if the access is not allowed
 
-        ret = check_location_mapset_module_access(
-            user_credentials=g.user.get_credentials(),
-            config=global_config,
-            location_name=location_name,
-            mapset_name=mapset_name,
-            module_name=module_name,
-        )
-        if ret is not None:
-            message_logger = MessageLogger()
-            message_logger.error(str(ret[1]))
-            abort(ret[0], str(ret[1]))
+    Args:
+        kwargs (dict): The keyword arguments of the wrapped function
 
-        return f(*args, **kwargs)
+    """
+    ret = check_location_mapset_module_access(
+        user_credentials=g.user.get_credentials(),
+        config=global_config,
+        location_name=kwargs.get("location_name"),
+        mapset_name=kwargs.get("mapset_name"),
+        module_name=kwargs.get("module_name"),
+    )
+    if ret is not None:
+        message_logger = MessageLogger()
+        message_logger.error(str(ret[1]))
+        abort(ret[0], str(ret[1]))
+
+
+def check_role_permissions_and_log_api_call(allowed_roles):
+    """Create a decorator that verifies the user role, checks the user
+    permissions and logs the API call
+
+    The decorator replaces the chain of the check_user_role or
+    check_admin_role, check_user_permissions and log_api_call decorators with
+    a single function call per request. The checks run in the same order as
+    in the decorator chain. The user must be authorized before, so it must be
+    applied inside of auth.login_required:
+
+        decorators = [
+            check_role_permissions_and_log_api_call(ADMIN_ROLES),
+            auth.login_required,
+        ]
 
-    return decorated_function
+    It will abort with a 401 response if the user role is not allowed
+
+    Args:
+        allowed_roles (tuple): The user roles that are allowed
+
+    Returns:
+        function: The decorator
+
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if g.user is None:
+                abort(401)
+
+            if g.user.get_role() not in allowed_roles:
+                abort(401)
+
+            _check_user_permissions(kwargs)
+
+            logger = ApiLogger()
+            logger.add_entry(user_id=g.user.get_id(), http_request=request)
+
+            return f(*args, **kwargs)
+
+        return decorated_function
+
+    return decorator
 
 
 def check_location_mapset_module_access(
@@ -27,23 +27,36 @@ Mapset management resources
 * List all mapsets
 * Create mapset, Delete mapset, Get info about a mapset
 * Lock mapset, unlock mapset, get mapset lock status
+* Lock and unlock a list of mapsets
 """
 
-from flask import jsonify, make_response
-from flask_restful_swagger_2 import swagger
-import pickle
+from flask import request
+from flask_restful_swagger_2 import Schema, swagger
+import json
+import os
 from actinia_api.swagger2.actinia_core.apidocs import mapset_management
 
+from actinia_core.rest.base.json_response import make_json_response
 from actinia_core.rest.base.resource_base import ResourceBase
 from actinia_core.core.common.app import auth
-from actinia_core.core.common.api_logger import log_api_call
-from actinia_core.core.common.redis_interface import enqueue_job
+from actinia_core.core.redis_cache import redis_cache_interface
+from actinia_core.core.redis_lock import (
+    generate_mapset_lock_id,
+    redis_lock_interface,
+)
+from actinia_core.models.response_models import (
+    ProcessingResponseModel,
+    StringListProcessingResultResponseModel,
+)
 from actinia_core.rest.base.endpoint_config import (
     check_endpoint,
     endpoint_decorator,
 )
-from actinia_core.rest.base.user_auth import check_user_permissions
-from actinia_core.rest.base.user_auth import check_admin_role, check_user_role
+from actinia_core.rest.base.user_auth import (
+    ADMIN_ROLES,
+    USER_ROLES,
+    check_role_permissions_and_log_api_call,
+)
 from actinia_core.processing.common.mapset_management import (
     list_raster_mapsets,
     read_current_region,
@@ -52,6 +65,7 @@ from actinia_core.processing.common.mapset_management import (
     get_mapset_lock,
     lock_mapset,
     unlock_mapset,
+    lock_mapset_batch,
 )
 
 __license__ = "GPLv3"
@@ -62,10 +76,180 @@ __copyright__ = (
 __maintainer__ = "mundialis"
 
 
+class MapsetLockBatchRequestModel(Schema):
+    """The request to lock or unlock a list of mapsets"""
+
+    type = "object"
+    properties = {
+        "op": {
+            "type": "string",
+            "description": "The operation that should be performed on all "
+            "mapsets",
+            "enum": ["lock", "unlock"],
+        },
+        "mapsets": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 1,
+            "uniqueItems": True,
+            "description": "The unique names of the mapsets",
+        },
+    }
+    required = ["op", "mapsets"]
+    example = {"op": "lock", "mapsets": ["mapset_a", "mapset_b"]}
+
+
+post_lock_batch_doc = {
+    "tags": ["Mapset Management"],
+    "description": "Lock or unlock a list of mapsets of a location in a "
+    "single job. The response contains the status of each mapset. "
+    "Minimum required user role: admin.",
+    "parameters": [
+        {
+            "name": "location_name",
+            "description": "The name of the location",
+            "required": True,
+            "in": "path",
+            "type": "string",
+            "default": "nc_spm_08",
+        },
+        {
+            "name": "lock_request",
+            "description": "The operation and the list of mapset names",
+            "required": True,
+            "in": "body",
+            "schema": MapsetLockBatchRequestModel,
+        },
+    ],
+    "responses": {
+        "200": {
+            "description": "The status of each mapset in the process results",
+            "schema": ProcessingResponseModel,
+        },
+        "400": {
+            "description": "The error message and a detailed error log",
+            "schema": ProcessingResponseModel,
+        },
+    },
+}
+
+
+def _get_mapset_list_cache_namespace(user_group, location_name):
+    """Return the cache namespace of all mapset lists of a location"""
+    return "MAPSET-LIST::%s/%s" % (user_group, location_name)
+
+
+def _is_async_request():
+    """Return True if the client requested to not wait for the job
+
+    The job is requested asynchronously with the query parameter async=true.
+    """
+    return request.args.get("async", "false").lower() == "true"
+
+
+def _get_mtime(path):
+    """Return the modification time of a path or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class MapsetJobResourceBase(ResourceBase):
+    """Base class of the resources that run a single job for a mapset"""
+
+    def _run_job(
+        self,
+        func,
+        location_name,
+        mapset_name,
+        queue_type_overwrite=None,
+        coalesce=False,
+        allow_async=False,
+    ):
+        """Run the job of a mapset request and create the response
+
+        Args:
+            func: The function to call from the subprocess/worker
+            location_name (str): Name of the location
+            mapset_name (str): Name of the mapset
+            queue_type_overwrite (bool): Use the overwrite queue type of the
+                                         configuration
+            coalesce (bool): Wait for an identical running job instead of
+                             enqueueing the job
+            allow_async (bool): Return the accepted response without waiting
+                                for the job if the client requested it with
+                                async=true
+
+        Returns:
+            flask.Response:
+            The JSON response of the job
+
+        """
+        rdc = self.preprocess(
+            has_json=False,
+            has_xml=False,
+            location_name=location_name,
+            mapset_name=mapset_name,
+        )
+
+        if allow_async is True and _is_async_request():
+            http_code, response_model = self.enqueue_job_and_accept(
+                func, rdc, queue_type_overwrite=queue_type_overwrite
+            )
+        else:
+            http_code, response_model = self.enqueue_job_and_wait(
+                func,
+                rdc,
+                queue_type_overwrite=queue_type_overwrite,
+                coalesce=coalesce,
+            )
+        return make_json_response(response_model, http_code)
+
+
 class ListMapsetsResource(ResourceBase):
     """List all mapsets in a location"""
 
     layer_type = None
+    # The time in seconds a mapset list is delivered from the cache
+    mapset_list_cache_expiration = 60
+
+    def _get_mapset_list_cache_key(self, location_name):
+        """Generate the cache key of the mapset list of a location
+
+        The key contains the generation of the cache namespace of the
+        location, that is renewed when a mapset is created or removed, and
+        the modification times of the global and the user group location
+        directories.
+
+        Args:
+            location_name (str): The name of the location
+
+        Returns:
+            str:
+            The cache key or None if the location does not exist
+        """
+        global_mtime = _get_mtime(
+            os.path.join(self.grass_data_base, location_name)
+        )
+        user_mtime = _get_mtime(
+            os.path.join(
+                self.grass_user_data_base, self.user_group, location_name
+            )
+        )
+        if global_mtime is None and user_mtime is None:
+            return None
+        namespace = _get_mapset_list_cache_namespace(
+            self.user_group, location_name
+        )
+        # The accessible global mapsets are user specific
+        return "%s/%i/%s/%s/%s" % (
+            namespace,
+            redis_cache_interface.get_generation(namespace),
+            self.user_id,
+            global_mtime,
+            user_mtime,
+        )
 
     # @check_queue_type_overwrite()
     @endpoint_decorator()
@@ -81,20 +265,39 @@ class ListMapsetsResource(ResourceBase):
             mapset_name="PERMANENT",
         )
         if rdc:
-            enqueue_job(
-                self.job_timeout,
-                list_raster_mapsets,
-                rdc,
-                queue_type_overwrite=True,
-            )
-            http_code, response_model = self.wait_until_finish()
+            cache_key = self._get_mapset_list_cache_key(location_name)
+            mapsets = None
+            if cache_key is not None:
+                mapsets = redis_cache_interface.get(cache_key)
+
+            if mapsets is not None:
+                http_code, response_model = self.create_finished_response(
+                    results=json.loads(mapsets),
+                    message="Processing successfully finished",
+                    response_model_class=(
+                        StringListProcessingResultResponseModel
+                    ),
+                )
+            else:
+                http_code, response_model = self.enqueue_job_and_wait(
+                    list_raster_mapsets, rdc, queue_type_overwrite=True
+                )
+                if (
+                    cache_key is not None
+                    and response_model["status"] == "finished"
+                ):
+                    redis_cache_interface.set(
+                        cache_key,
+                        json.dumps(response_model["process_results"]),
+                        self.mapset_list_cache_expiration,
+                    )
         else:
-            http_code, response_model = pickle.loads(self.response_data)
+            http_code, response_model = self.http_code, self.response_model
 
-        return make_response(jsonify(response_model), http_code)
+        return make_json_response(response_model, http_code)
 
 
-class MapsetManagementResourceUser(ResourceBase):
+class MapsetManagementResourceUser(MapsetJobResourceBase):
     """This class returns information about a mapset"""
 
     def __init__(self):
@@ -107,53 +310,43 @@ class MapsetManagementResourceUser(ResourceBase):
         Get the current computational region of the mapset and the projection
         of the location as WKT string.
         """
-        rdc = self.preprocess(
-            has_json=False,
-            has_xml=False,
-            location_name=location_name,
-            mapset_name=mapset_name,
-        )
-
-        enqueue_job(
-            self.job_timeout,
+        return self._run_job(
             read_current_region,
-            rdc,
+            location_name,
+            mapset_name,
             queue_type_overwrite=True,
         )
-        http_code, response_model = self.wait_until_finish()
-        return make_response(jsonify(response_model), http_code)
 
 
-class MapsetManagementResourceAdmin(ResourceBase):
+class MapsetManagementResourceAdmin(MapsetJobResourceBase):
     """This class manages the creation, deletion and modification of mapsets
 
     This is allowed for administrators and users
     """
 
     decorators = [
-        log_api_call,
-        check_user_permissions,
-        check_user_role,
+        check_role_permissions_and_log_api_call(USER_ROLES),
         auth.login_required,
     ]
 
     def __init__(self):
         ResourceBase.__init__(self)
 
+    def _delete_cached_mapset_lists(self, location_name):
+        """Invalidate all cached mapset lists of the location"""
+        redis_cache_interface.new_generation(
+            _get_mapset_list_cache_namespace(self.user_group, location_name)
+        )
+
     @endpoint_decorator()
     @swagger.doc(check_endpoint("post", mapset_management.post_user_doc))
     def post(self, location_name, mapset_name):
         """Create a new mapset in an existing location."""
-        rdc = self.preprocess(
-            has_json=False,
-            has_xml=False,
-            location_name=location_name,
-            mapset_name=mapset_name,
+        response = self._run_job(
+            create_mapset, location_name, mapset_name, coalesce=True
         )
-
-        enqueue_job(self.job_timeout, create_mapset, rdc)
-        http_code, response_model = self.wait_until_finish()
-        return make_response(jsonify(response_model), http_code)
+        self._delete_cached_mapset_lists(location_name)
+        return response
 
     def put(self, location_name, mapset_name):
         """Modify the region of a mapset
@@ -174,28 +367,28 @@ class MapsetManagementResourceAdmin(ResourceBase):
     @endpoint_decorator()
     @swagger.doc(check_endpoint("delete", mapset_management.delete_user_doc))
     def delete(self, location_name, mapset_name):
-        """Delete an existing mapset"""
-        rdc = self.preprocess(
-            has_json=False,
-            has_xml=False,
-            location_name=location_name,
-            mapset_name=mapset_name,
-        )
+        """Delete an existing mapset
 
-        enqueue_job(
-            self.job_timeout, delete_mapset, rdc, queue_type_overwrite=True
+        With the query parameter async=true the request does not wait for
+        the deletion, it returns the accepted response with the status URL.
+        """
+        response = self._run_job(
+            delete_mapset,
+            location_name,
+            mapset_name,
+            queue_type_overwrite=True,
+            coalesce=True,
+            allow_async=True,
         )
-        http_code, response_model = self.wait_until_finish()
-        return make_response(jsonify(response_model), http_code)
+        self._delete_cached_mapset_lists(location_name)
+        return response
 
 
-class MapsetLockManagementResource(ResourceBase):
+class MapsetLockManagementResource(MapsetJobResourceBase):
     """Lock a mapset"""
 
     decorators = [
-        log_api_call,
-        check_user_permissions,
-        check_admin_role,
+        check_role_permissions_and_log_api_call(ADMIN_ROLES),
         auth.login_required,
     ]
 
@@ -210,40 +403,117 @@ class MapsetLockManagementResource(ResourceBase):
             mapset_name=mapset_name,
         )
 
-        enqueue_job(
-            self.job_timeout, get_mapset_lock, rdc, queue_type_overwrite=True
+        # The lock status is read directly from the lock database. Only if the
+        # mapset is not locked, the job is required to check that the mapset
+        # exists.
+        lock_id = generate_mapset_lock_id(
+            self.user_group, location_name, mapset_name
         )
-        http_code, response_model = self.wait_until_finish()
-        return make_response(jsonify(response_model), http_code)
+        if redis_lock_interface.get(lock_id) is True:
+            http_code, response_model = self.create_finished_response(
+                results=True, message="Mapset lock state: True"
+            )
+        else:
+            http_code, response_model = self.enqueue_job_and_wait(
+                get_mapset_lock, rdc, queue_type_overwrite=True
+            )
+        return make_json_response(response_model, http_code)
 
     @endpoint_decorator()
     @swagger.doc(check_endpoint("post", mapset_management.post_lock_doc))
     def post(self, location_name, mapset_name):
-        """Create a location/mapset lock."""
-        rdc = self.preprocess(
-            has_json=False,
-            has_xml=False,
-            location_name=location_name,
-            mapset_name=mapset_name,
-        )
+        """Create a location/mapset lock.
 
-        enqueue_job(self.job_timeout, lock_mapset, rdc)
-        http_code, response_model = self.wait_until_finish()
-        return make_response(jsonify(response_model), http_code)
+        With the query parameter async=true the request does not wait for
+        the lock, it returns the accepted response with the status URL.
+        """
+        # A lock must not be coalesced, only one request can acquire it
+        return self._run_job(
+            lock_mapset,
+            location_name,
+            mapset_name,
+            allow_async=True,
+        )
 
     @endpoint_decorator()
     @swagger.doc(check_endpoint("delete", mapset_management.delete_lock_doc))
     def delete(self, location_name, mapset_name):
-        """Delete a location/mapset lock."""
+        """Delete a location/mapset lock.
+
+        With the query parameter async=true the request does not wait for
+        the unlock, it returns the accepted response with the status URL.
+        """
+        return self._run_job(
+            unlock_mapset,
+            location_name,
+            mapset_name,
+            queue_type_overwrite=True,
+            coalesce=True,
+            allow_async=True,
+        )
+
+
+class MapsetLockBatchResource(ResourceBase):
+    """Lock or unlock a list of mapsets"""
+
+    decorators = [
+        check_role_permissions_and_log_api_call(ADMIN_ROLES),
+        auth.login_required,
+    ]
+
+    # The supported lock operations
+    lock_operations = MapsetLockBatchRequestModel.properties["op"]["enum"]
+
+    @endpoint_decorator()
+    @swagger.doc(check_endpoint("post", post_lock_batch_doc))
+    def post(self, location_name):
+        """Lock or unlock a list of mapsets of a location in a single job
+
+        The JSON request body must contain the list of unique mapset names
+        and the operation:
+
+            {"mapsets": ["mapset_a", "mapset_b"], "op": "lock"}
+
+        Args:
+            location_name (str): Name of the location
+
+        Returns:
+            flask.Response:
+            HTTP 200 and JSON document with the status of each mapset in
+            case of success, HTTP 400 otherwise
+
+        """
         rdc = self.preprocess(
-            has_json=False,
+            has_json=True,
             has_xml=False,
             location_name=location_name,
-            mapset_name=mapset_name,
         )
+        if rdc is None:
+            return make_json_response(self.response_model, self.http_code)
+
+        if isinstance(self.request_data, dict) is False:
+            return self.get_error_response(
+                message="Wrong format for the mapset lock request"
+            )
+        if self.request_data.get("op") not in self.lock_operations:
+            return self.get_error_response(
+                message="The lock operation must be one of: %s"
+                % ", ".join(self.lock_operations)
+            )
+        mapsets = self.request_data.get("mapsets")
+        if isinstance(mapsets, list) is False or len(mapsets) == 0:
+            return self.get_error_response(message="Empty mapset list")
+        for mapset_name in mapsets:
+            if isinstance(mapset_name, str) is False or "/" in mapset_name:
+                return self.get_error_response(
+                    message="Invalid mapset name <%s>" % str(mapset_name)
+                )
+        if len(set(mapsets)) != len(mapsets):
+            return self.get_error_response(
+                message="The mapset names must be unique"
+            )
 
-        enqueue_job(
-            self.job_timeout, unlock_mapset, rdc, queue_type_overwrite=True
+        http_code, response_model = self.enqueue_job_and_wait(
+            lock_mapset_batch, rdc, queue_type_overwrite=True
         )
-        http_code, response_model = self.wait_until_finish()
-        return make_response(jsonify(response_model), http_code)
+        return make_json_response(response_model, http_code)
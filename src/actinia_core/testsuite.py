@@ -27,6 +27,8 @@ Base class for GRASS GIS REST API tests
 import base64
 import os
 import requests
+import signal
+import socket
 import time
 import unittest
 from flask.json import loads as json_loads
@@ -50,6 +52,37 @@ __copyright__ = (
 __maintainer__ = "mundialis"
 
 
+def start_redis_server(port):
+    """Start a redis server for user and logging management and wait until
+    it accepts connections
+
+    Args:
+        port (int): The port of the redis server
+
+    Returns:
+        int:
+        The process id of the redis server
+
+    Raises:
+        RuntimeError: If the redis server does not accept connections, the
+                      server process is killed in this case
+    """
+    redis_pid = os.spawnl(
+        os.P_NOWAIT,
+        "/usr/bin/redis-server",
+        "common/redis.conf",
+        "--port %i" % port,
+    )
+    # The waits grow up to 500 ms, the server gets about 3 s to start
+    for delay in (0.01, 0.02, 0.04, 0.08, 0.16, 0.32) + (0.5,) * 5:
+        time.sleep(delay)
+        with socket.socket() as sock:
+            if sock.connect_ex(("localhost", port)) == 0:
+                return redis_pid
+    os.kill(redis_pid, signal.SIGTERM)
+    raise RuntimeError("The redis server did not start")
+
+
 class ActiniaRequests(object):
     """Requests to a actinia server are performed with this class
 
@@ -22,9 +22,53 @@
 #
 #######
 """
-    Dummy conftest.py for actinia API.
+    conftest.py for actinia API.
 
-    If you don't know what this is for, just leave it empty.
     Read more about conftest.py under:
     https://pytest.org/latest/plugins.html
 """
+import os
+import signal
+
+import pytest
+
+from actinia_core.core.common.config import global_config
+from actinia_core.testsuite import start_redis_server
+
+custom_actinia_cfg = False
+
+# Set this variable to use a actinia config file in a docker container
+if "ACTINIA_CUSTOM_TEST_CFG" in os.environ:
+    custom_actinia_cfg = str(os.environ["ACTINIA_CUSTOM_TEST_CFG"])
+
+
+@pytest.fixture(scope="session")
+def redis_server():
+    """Start the redis server for user and logging management once per
+    test session and stop it after all tests ran
+
+    The redis server configuration of the test session is set in the
+    global configuration, if ACTINIA_CUSTOM_TEST_CFG is set it is read from
+    this actinia config file and no redis server is started.
+    """
+    # If docker config
+    if custom_actinia_cfg is not False:
+        global_config.read(custom_actinia_cfg)
+        print(global_config)
+        yield
+        return
+
+    # Set the port to the test redis server
+    global_config.REDIS_SERVER_URL = "localhost"
+    global_config.REDIS_SERVER_PORT = 7000
+
+    # Setup the test environment
+    global_config.GRASS_GIS_BASE = "/usr/local/grass/"
+    global_config.GRASS_GIS_START_SCRIPT = "/usr/local/bin/grass"
+
+    redis_pid = start_redis_server(global_config.REDIS_SERVER_PORT)
+
+    yield
+
+    # Kill the redis server
+    os.kill(redis_pid, signal.SIGTERM)
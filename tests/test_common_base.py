@@ -24,11 +24,8 @@
 """
 Tests: Common test case base
 """
-import atexit
 import unittest
-import signal
-import time
-import os
+import pytest
 from actinia_core.core.common.config import global_config
 import actinia_core.core.common.redis_interface as redis_interface
 from actinia_core.core.common.app import flask_app
@@ -41,75 +38,19 @@ __copyright__ = (
 __maintainer__ = "Sören Gebbert"
 __email__ = "soerengebbert@googlemail.com"
 
-redis_pid = None
-custom_actinia_cfg = False
-
-# Set this variable to use a actinia config file in a docker container
-if "ACTINIA_CUSTOM_TEST_CFG" in os.environ:
-    custom_actinia_cfg = str(os.environ["ACTINIA_CUSTOM_TEST_CFG"])
-
-
-def setup_environment():
-
-    # If docker config
-    if custom_actinia_cfg is not False:
-        global_config.read(custom_actinia_cfg)
-        return
-
-    global redis_pid
-    # Set the port to the test redis server
-    global_config.REDIS_SERVER_SERVER = "localhost"
-    global_config.REDIS_SERVER_PORT = 7000
-
-    # home = os.getenv("HOME")
-
-    # GRASS
-
-    # Setup the test environment
-    global_config.GRASS_GIS_BASE = "/usr/local/grass/"
-    global_config.GRASS_GIS_START_SCRIPT = "/usr/local/bin/grass"
-    # global_config.GRASS_DATABASE= "/usr/local/grass_test_db"
-    # global_config.GRASS_DATABASE = "%s/actinia/grass_test_db" % home
-
-    # Start the redis server for user and logging management
-    redis_pid = os.spawnl(
-        os.P_NOWAIT,
-        "/usr/bin/redis-server",
-        "common/redis.conf",
-        "--port %i" % global_config.REDIS_SERVER_PORT,
-    )
-    time.sleep(1)
-
-
-def stop_redis():
-    global redis_pid
-    # Kill th redis server
-    if custom_actinia_cfg is not False:
-        return
-    os.kill(redis_pid, signal.SIGTERM)
-
-
-# Register the redis stop function
-atexit.register(stop_redis)
-# Setup the environment
-setup_environment()
-
 
+@pytest.mark.usefixtures("redis_server")
 class CommonTestCaseBase(unittest.TestCase):
     """
     This is the base class for the common testing
+
+    The redis server is started and configured by the session scoped
+    redis_server fixture in conftest.py.
     """
 
     @classmethod
     def setUpClass(cls):
 
-        if custom_actinia_cfg is not False:
-            global_config.read(custom_actinia_cfg)
-            print(global_config)
-        else:
-            global_config.REDIS_SERVER_URL = "localhost"
-            global_config.REDIS_SERVER_PORT = 7000
-
         args = (
             global_config.REDIS_SERVER_URL,
             global_config.REDIS_SERVER_PORT,
@@ -24,8 +24,17 @@
 """
 Tests: Mapset test case
 """
+from flask.json import dumps as json_dumps
 from flask.json import loads as json_load
+import pickle
+import threading
+import time
 import unittest
+import uuid
+
+from actinia_core.core.common.app import flask_app
+from actinia_core.core.common.config import global_config
+from actinia_core.core.resources_logger import ResourceLogger
 
 try:
     from .test_resource_base import ActiniaResourceTestCaseBase, URL_PREFIX
@@ -62,6 +71,43 @@ class MapsetTestCase(ActiniaResourceTestCaseBase):
         self.assertTrue("PERMANENT" in mapsets)
         self.assertTrue("user1" in mapsets)
 
+    def test_list_mapsets_cache_invalidation(self):
+        url = URL_PREFIX + "/locations/nc_spm_08/mapsets"
+        self.delete_mapset("test_mapset_cache")
+
+        # The second request is answered from the mapset list cache, without
+        # running g.mapsets
+        process_logs = []
+        for _ in range(2):
+            rv = self.server.get(url, headers=self.admin_auth_header)
+            print(rv.data)
+            self.assertEqual(
+                rv.status_code,
+                200,
+                "HTML status code is wrong %i" % rv.status_code,
+            )
+            response_model = json_load(rv.data)
+            mapsets = response_model["process_results"]
+            self.assertTrue("PERMANENT" in mapsets)
+            self.assertFalse("test_mapset_cache" in mapsets)
+            process_logs.append(response_model.get("process_log"))
+        self.assertTrue(process_logs[0])
+        self.assertFalse(process_logs[1])
+
+        # Creating a mapset must invalidate the cached mapset list
+        self.create_new_mapset("test_mapset_cache")
+        rv = self.server.get(url, headers=self.admin_auth_header)
+        print(rv.data)
+        mapsets = json_load(rv.data)["process_results"]
+        self.assertTrue("test_mapset_cache" in mapsets)
+
+        # Deleting a mapset must invalidate the cached mapset list
+        self.delete_mapset("test_mapset_cache")
+        rv = self.server.get(url, headers=self.admin_auth_header)
+        print(rv.data)
+        mapsets = json_load(rv.data)["process_results"]
+        self.assertFalse("test_mapset_cache" in mapsets)
+
     def test_mapsets_region_1(self):
         rv = self.server.get(
             URL_PREFIX + "/locations/nc_spm_08/mapsets/PERMANENT/info",
@@ -364,6 +410,341 @@ class MapsetTestCase(ActiniaResourceTestCaseBase):
             rv.mimetype, "application/json", "Wrong mimetype %s" % rv.mimetype
         )
 
+    def test_mapset_batch_locking(self):
+        # Create new mapsets
+        for mapset in ("test_mapset_batch_1", "test_mapset_batch_2"):
+            self.server.delete(
+                URL_PREFIX + "/locations/nc_spm_08/mapsets/%s/lock" % mapset,
+                headers=self.admin_auth_header,
+            )
+            self.server.delete(
+                URL_PREFIX + "/locations/nc_spm_08/mapsets/%s" % mapset,
+                headers=self.admin_auth_header,
+            )
+            rv = self.server.post(
+                URL_PREFIX + "/locations/nc_spm_08/mapsets/%s" % mapset,
+                headers=self.admin_auth_header,
+            )
+            self.assertEqual(
+                rv.status_code,
+                200,
+                "HTML status code is wrong %i" % rv.status_code,
+            )
+
+        mapsets = ["test_mapset_batch_1", "test_mapset_batch_2", "no_mapset"]
+        # Lock mapsets
+        rv = self.server.post(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/lock_batch",
+            headers=self.admin_auth_header,
+            data=json_dumps({"mapsets": mapsets, "op": "lock"}),
+            content_type="application/json",
+        )
+        print(rv.data)
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        self.assertEqual(
+            rv.mimetype, "application/json", "Wrong mimetype %s" % rv.mimetype
+        )
+        mapset_status = json_load(rv.data)["process_results"]
+        self.assertEqual(
+            [status["status"] for status in mapset_status],
+            ["success", "success", "error"],
+        )
+
+        # Locking twice must fail
+        rv = self.server.post(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/lock_batch",
+            headers=self.admin_auth_header,
+            data=json_dumps({"mapsets": mapsets[:1], "op": "lock"}),
+            content_type="application/json",
+        )
+        mapset_status = json_load(rv.data)["process_results"]
+        self.assertEqual(mapset_status[0]["status"], "error")
+
+        rv = self.server.get(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_batch_2/"
+            "lock",
+            headers=self.admin_auth_header,
+        )
+        self.assertTrue(json_load(rv.data)["process_results"])
+
+        # Unlock mapsets
+        rv = self.server.post(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/lock_batch",
+            headers=self.admin_auth_header,
+            data=json_dumps({"mapsets": mapsets[:2], "op": "unlock"}),
+            content_type="application/json",
+        )
+        print(rv.data)
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        mapset_status = json_load(rv.data)["process_results"]
+        self.assertEqual(
+            [status["status"] for status in mapset_status],
+            ["success", "success"],
+        )
+
+        rv = self.server.get(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_batch_2/"
+            "lock",
+            headers=self.admin_auth_header,
+        )
+        self.assertFalse(json_load(rv.data)["process_results"])
+
+        # Wrong operation
+        rv = self.server.post(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/lock_batch",
+            headers=self.admin_auth_header,
+            data=json_dumps({"mapsets": mapsets, "op": "remove"}),
+            content_type="application/json",
+        )
+        self.assertEqual(
+            rv.status_code,
+            400,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+
+        # Duplicate mapset names
+        rv = self.server.post(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/lock_batch",
+            headers=self.admin_auth_header,
+            data=json_dumps({"mapsets": mapsets[:1] * 2, "op": "lock"}),
+            content_type="application/json",
+        )
+        self.assertEqual(
+            rv.status_code,
+            400,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        rv = self.server.get(
+            URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_batch_1/"
+            "lock",
+            headers=self.admin_auth_header,
+        )
+        self.assertFalse(json_load(rv.data)["process_results"])
+
+        for mapset in mapsets[:2]:
+            self.server.delete(
+                URL_PREFIX + "/locations/nc_spm_08/mapsets/%s" % mapset,
+                headers=self.admin_auth_header,
+            )
+
+    def test_mapset_async_locking_and_deletion(self):
+        mapset_url = URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_3"
+        self.server.delete(
+            mapset_url + "/lock", headers=self.admin_auth_header
+        )
+        self.server.delete(mapset_url, headers=self.admin_auth_header)
+        rv = self.server.post(mapset_url, headers=self.admin_auth_header)
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+
+        # Lock mapset without waiting
+        rv = self.server.post(
+            mapset_url + "/lock?async=true", headers=self.admin_auth_header
+        )
+        self.assertEqual(json_load(rv.data)["status"], "accepted")
+        self.waitAsyncStatusAssertHTTP(
+            rv, headers=self.admin_auth_header, http_status=200
+        )
+        rv = self.server.get(
+            mapset_url + "/lock", headers=self.admin_auth_header
+        )
+        self.assertTrue(json_load(rv.data)["process_results"])
+
+        # Unlock mapset without waiting
+        rv = self.server.delete(
+            mapset_url + "/lock?async=true", headers=self.admin_auth_header
+        )
+        self.assertEqual(json_load(rv.data)["status"], "accepted")
+        self.waitAsyncStatusAssertHTTP(
+            rv, headers=self.admin_auth_header, http_status=200
+        )
+        rv = self.server.get(
+            mapset_url + "/lock", headers=self.admin_auth_header
+        )
+        self.assertFalse(json_load(rv.data)["process_results"])
+
+        # Delete mapset without waiting
+        rv = self.server.delete(
+            mapset_url + "?async=true", headers=self.admin_auth_header
+        )
+        self.assertEqual(json_load(rv.data)["status"], "accepted")
+        self.waitAsyncStatusAssertHTTP(
+            rv, headers=self.admin_auth_header, http_status=200
+        )
+
+    def _create_mapset(self, mapset_url):
+        lock_url = mapset_url + "/lock"
+        self.server.delete(lock_url, headers=self.admin_auth_header)
+        self.server.delete(mapset_url, headers=self.admin_auth_header)
+        rv = self.server.post(mapset_url, headers=self.admin_auth_header)
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+
+    def _check_own_resource(self, rv, user_id, auth_header):
+        """Check that the response and the resource entry of a request
+        identify the resource and user of the request
+        """
+        self.assertEqual(
+            rv.status_code,
+            200,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        response_model = json_load(rv.data)
+        resource_id = response_model["resource_id"]
+        self.assertEqual(response_model["status"], "finished")
+        self.assertEqual(response_model["user_id"], user_id)
+        self.assertIn(resource_id, response_model["urls"]["status"])
+
+        rv = self.server.get(
+            URL_PREFIX + "/resources/%s/%s" % (user_id, resource_id),
+            headers=auth_header,
+        )
+        resource_model = json_load(rv.data)
+        self.assertEqual(resource_model["status"], "finished")
+        self.assertEqual(resource_model["resource_id"], resource_id)
+        self.assertEqual(resource_model["user_id"], user_id)
+        self.assertIn(resource_id, resource_model["urls"]["status"])
+        return response_model
+
+    def _create_resource_logger(self):
+        kwargs = dict()
+        kwargs["host"] = global_config.REDIS_SERVER_URL
+        kwargs["port"] = global_config.REDIS_SERVER_PORT
+        if global_config.REDIS_SERVER_PW:
+            kwargs["password"] = global_config.REDIS_SERVER_PW
+        return ResourceLogger(**kwargs)
+
+    def test_mapset_unlock_coalescing(self):
+        mapset_url = URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_4"
+        self._create_mapset(mapset_url)
+
+        # Register a finished unlock job of another user as running job of
+        # the mapset, the request must wait for it instead of enqueueing
+        resource_logger = self._create_resource_logger()
+        job_key = "unlock_mapset/%s/nc_spm_08/test_mapset_4" % self.admin_group
+        other_resource_id = "resource_id-%s" % uuid.uuid4()
+        other_model = {
+            "status": "finished",
+            "user_id": self.root_id,
+            "resource_id": other_resource_id,
+            "message": "Mapset <test_mapset_4> successfully unlocked",
+            "accept_timestamp": time.time(),
+            "timestamp": time.time(),
+            "urls": {"resources": [], "status": other_resource_id},
+        }
+        resource_logger.commit(
+            self.root_id,
+            other_resource_id,
+            None,
+            pickle.dumps([200, other_model]),
+        )
+        resource_logger.set_inflight(job_key, self.root_id, other_resource_id)
+
+        try:
+            rv = self.server.delete(
+                mapset_url + "/lock", headers=self.admin_auth_header
+            )
+        finally:
+            resource_logger.delete_inflight(
+                job_key, self.root_id, other_resource_id
+            )
+
+        response_model = self._check_own_resource(
+            rv, self.admin_id, self.admin_auth_header
+        )
+        self.assertNotEqual(response_model["resource_id"], other_resource_id)
+        self.assertEqual(response_model["message"], other_model["message"])
+        self.assertEqual(
+            response_model["api_info"]["endpoint"],
+            "mapsetlockmanagementresource",
+        )
+
+        self.server.delete(mapset_url, headers=self.admin_auth_header)
+
+    def test_mapset_unlock_coalescing_missing_resource(self):
+        mapset_url = URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_6"
+        self._create_mapset(mapset_url)
+
+        # Register a running job without resource entry, the request must
+        # not wait for it
+        resource_logger = self._create_resource_logger()
+        job_key = "unlock_mapset/%s/nc_spm_08/test_mapset_6" % self.admin_group
+        other_resource_id = "resource_id-%s" % uuid.uuid4()
+        resource_logger.set_inflight(job_key, self.root_id, other_resource_id)
+
+        try:
+            rv = self.server.delete(
+                mapset_url + "/lock", headers=self.admin_auth_header
+            )
+        finally:
+            resource_logger.delete_inflight(
+                job_key, self.root_id, other_resource_id
+            )
+
+        self.assertEqual(
+            rv.status_code,
+            400,
+            "HTML status code is wrong %i" % rv.status_code,
+        )
+        response_model = json_load(rv.data)
+        self.assertEqual(response_model["status"], "error")
+        self.assertEqual(response_model["user_id"], self.admin_id)
+        self.assertIn(other_resource_id, response_model["message"])
+
+        self.server.delete(mapset_url, headers=self.admin_auth_header)
+
+    def test_mapset_concurrent_unlock(self):
+        mapset_url = URL_PREFIX + "/locations/nc_spm_08/mapsets/test_mapset_5"
+        self._create_mapset(mapset_url)
+
+        # Two identical requests of different users at the same time
+        responses = dict()
+
+        def unlock(user_id, auth_header):
+            server = flask_app.test_client()
+            responses[user_id] = server.delete(
+                mapset_url + "/lock", headers=auth_header
+            )
+
+        threads = [
+            threading.Thread(
+                target=unlock, args=(self.admin_id, self.admin_auth_header)
+            ),
+            threading.Thread(
+                target=unlock, args=(self.root_id, self.root_auth_header)
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        admin_model = self._check_own_resource(
+            responses[self.admin_id], self.admin_id, self.admin_auth_header
+        )
+        root_model = self._check_own_resource(
+            responses[self.root_id], self.root_id, self.root_auth_header
+        )
+        self.assertNotEqual(
+            admin_model["resource_id"], root_model["resource_id"]
+        )
+
+        self.server.delete(mapset_url, headers=self.admin_auth_header)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -27,8 +27,11 @@ Tests: Actinia resource test case base
 import atexit
 import os
 import signal
-import time
-from actinia_core.testsuite import ActiniaTestCaseBase, URL_PREFIX
+from actinia_core.testsuite import (
+    ActiniaTestCaseBase,
+    URL_PREFIX,
+    start_redis_server,
+)
 from actinia_core.core.common.config import global_config
 from actinia_core.endpoints import create_endpoints
 
@@ -90,13 +93,7 @@ def setup_environment():
 
     if server_test is False and custom_actinia_cfg is False:
         # Start the redis server for user and logging management
-        redis_pid = os.spawnl(
-            os.P_NOWAIT,
-            "/usr/bin/redis-server",
-            "common/redis.conf",
-            "--port %i" % global_config.REDIS_SERVER_PORT,
-        )
-        time.sleep(1)
+        redis_pid = start_redis_server(global_config.REDIS_SERVER_PORT)
 
     if server_test is False and custom_actinia_cfg is not False:
         global_config.read(custom_actinia_cfg)
@@ -215,6 +215,47 @@ class ResourceLoggingTestCase(ActiniaResourceTestCaseBase):
 
         self.assertFalse(ret)
 
+    def test_inflight(self):
+        job_key = "unlock_mapset/group/nc_spm_08/%s" % self.resource_id
+
+        ret = self.log.set_inflight(
+            job_key, user_id=self.user_id, resource_id=self.resource_id
+        )
+
+        self.assertEqual(None, ret)
+
+        # An identical job of another user gets the running resource
+        ret = self.log.set_inflight(
+            job_key, user_id="other_user", resource_id="resource_id-other"
+        )
+
+        self.assertEqual((self.user_id, str(self.resource_id), None), ret)
+
+        # Only the running resource can remove the inflight entry
+        ret = self.log.delete_inflight(
+            job_key, user_id="other_user", resource_id="resource_id-other"
+        )
+
+        self.assertFalse(ret)
+
+        ret = self.log.delete_inflight(
+            job_key, user_id=self.user_id, resource_id=self.resource_id
+        )
+
+        self.assertTrue(ret)
+
+        ret = self.log.set_inflight(
+            job_key, user_id="other_user", resource_id="resource_id-other"
+        )
+
+        self.assertEqual(None, ret)
+
+        ret = self.log.delete_inflight(
+            job_key, user_id="other_user", resource_id="resource_id-other"
+        )
+
+        self.assertTrue(ret)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2023 mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Tests: Redis base unittest case
+"""
+import pytest
+
+from actinia_core.core.common import redis_base
+from actinia_core.core.common.redis_base import (
+    disconnect_connection_pools,
+    get_connection_pool,
+)
+
+__license__ = "GPLv3"
+__author__ = "mundialis"
+__copyright__ = "Copyright 2023, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis"
+
+
+@pytest.fixture
+def connection_pools(monkeypatch):
+    """Isolate the tests from the connection pools of the running session"""
+    monkeypatch.setattr(redis_base, "connection_pools", {})
+    return redis_base.connection_pools
+
+
+@pytest.mark.unittest
+def test_connection_pool_is_shared(connection_pools):
+    """Test that a redis server gets a single connection pool"""
+    pool, created = get_connection_pool("redis-test-host", 7000)
+    same_pool, same_created = get_connection_pool("redis-test-host", 7000)
+    other_pool, _ = get_connection_pool("redis-test-host", 7001)
+
+    assert created is True
+    assert same_created is False
+    assert same_pool is pool
+    assert other_pool is not pool
+
+    disconnect_connection_pools()
+
+
+@pytest.mark.unittest
+def test_disconnect_connection_pools(connection_pools):
+    """Test that closed connection pools are created again"""
+    pool, _ = get_connection_pool("redis-test-host", 7000)
+
+    disconnect_connection_pools()
+    new_pool, created = get_connection_pool("redis-test-host", 7000)
+
+    assert created is True
+    assert new_pool is not pool
+    assert list(connection_pools.values()) == [new_pool]
+
+    disconnect_connection_pools()
+    assert new_pool not in connection_pools.values()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2023 mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Tests: Redis resource update listener unittest case
+"""
+import pytest
+
+from actinia_core.core.redis_resource_updates import (
+    ResourceUpdateListener,
+    ResourceUpdateSubscription,
+)
+
+__license__ = "GPLv3"
+__author__ = "mundialis"
+__copyright__ = "Copyright 2023, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis"
+
+
+@pytest.mark.unittest
+def test_subscription_wait():
+    """Test that an announcement is consumed by a single wait"""
+    listener = ResourceUpdateListener("RESOURCE-ID-CHANNEL::*")
+    subscription = ResourceUpdateSubscription(listener, "channel")
+
+    subscription.event.set()
+
+    assert subscription.wait(0) is True
+    assert subscription.wait(0) is False
+
+
+@pytest.mark.unittest
+def test_subscription_close():
+    """Test that closed subscriptions are removed from the listener"""
+    listener = ResourceUpdateListener("RESOURCE-ID-CHANNEL::*")
+    subscription = ResourceUpdateSubscription(listener, "channel")
+    other_subscription = ResourceUpdateSubscription(listener, "channel")
+    listener.subscriptions["channel"] = {subscription, other_subscription}
+
+    subscription.close()
+    assert listener.subscriptions["channel"] == {other_subscription}
+
+    other_subscription.close()
+    assert "channel" not in listener.subscriptions
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#######
+# actinia-core - an open source REST API for scalable, distributed, high
+# performance processing of geographical data that uses GRASS GIS for
+# computational tasks. For details, see https://actinia.mundialis.de/
+#
+# Copyright (c) 2023 mundialis GmbH & Co. KG
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#######
+
+"""
+Tests: Resource data container unittest case
+"""
+import pickle
+import pytest
+
+from actinia_core.core.resource_data_container import ResourceDataContainer
+
+__license__ = "GPLv3"
+__author__ = "mundialis"
+__copyright__ = "Copyright 2023, mundialis GmbH & Co. KG"
+__maintainer__ = "mundialis"
+
+
+def create_rdc():
+    return ResourceDataContainer(
+        grass_data_base="/actinia_core/grassdb",
+        grass_user_data_base="/actinia_core/userdata",
+        grass_base_dir="/usr/local/grass",
+        request_data={"list": [{"id": "1", "module": "g.region"}]},
+        user_id="user",
+        user_group="group",
+        resource_id="resource_id-1234",
+        iteration=None,
+        status_url="http://localhost/resources/user/resource_id-1234",
+        api_info={"endpoint": "listmapsetsresource", "method": "GET"},
+        resource_url_base="http://localhost/resources/user/__None__",
+        orig_time=1.0,
+        orig_datetime="2023-01-01 00:00:00",
+        user_credentials={"permissions": {"process_num_limit": 1}},
+        config=None,
+        location_name="nc_spm_08",
+        mapset_name="PERMANENT",
+        map_name=None,
+    )
+
+
+@pytest.mark.unittest
+def test_pickle_roundtrip():
+    """Test that all attributes survive pickling"""
+    rdc = create_rdc()
+    rdc.set_user_data({"key": "value"})
+    rdc.set_queue_name("local")
+    rdc.set_storage_model_to_gcs()
+
+    restored = pickle.loads(pickle.dumps(rdc))
+
+    assert restored.__dict__ == rdc.__dict__
+
+
+@pytest.mark.unittest
+def test_pickle_state_covers_all_attributes():
+    """Test that no attribute of the container is missed by the state"""
+    rdc = create_rdc()
+
+    assert set(rdc._state_attributes) == set(rdc.__dict__)
+
+
+@pytest.mark.unittest
+def test_pickle_extra_attributes():
+    """Test that attributes missing in the state survive pickling"""
+    rdc = create_rdc()
+    rdc.extra_attribute = {"key": "value"}
+
+    restored = pickle.loads(pickle.dumps(rdc))
+
+    assert restored.extra_attribute == {"key": "value"}
+    assert restored.__dict__ == rdc.__dict__
+
+
+@pytest.mark.unittest
+def test_unpickle_instance_dict_state():
+    """Test that containers pickled with their instance dict are restored"""
+    rdc = create_rdc()
+    rdc.set_queue_name("local")
+
+    restored = ResourceDataContainer.__new__(ResourceDataContainer)
+    restored.__setstate__(dict(rdc.__dict__))
+
+    assert restored.__dict__ == rdc.__dict__
+
+
+@pytest.mark.unittest
+def test_pickle_without_attribute_names():
+    """Test that the attribute names are not part of the pickle stream"""
+    data = pickle.dumps(create_rdc())
+
+    assert b"grass_user_data_base" not in data